@@ -5,11 +5,12 @@ import re
 from pathlib import Path
 
 VERSION_FILE = Path("src/momentum/__version__.py")
+VERSION_RE = re.compile(r'__version__\s*=\s*["\']([\d.]+)["\']')
 
 
 def get_current_version():
     content = VERSION_FILE.read_text()
-    match = re.search(r'__version__\s*=\s*["\']([\d.]+)["\']', content)
+    match = VERSION_RE.search(content)
     if not match:
         raise ValueError("Version string not found")
     return match.group(1)
@@ -33,11 +34,7 @@ def bump(version, part):
 
 def set_version(new_version):
     content = VERSION_FILE.read_text()
-    new_content = re.sub(
-        r'__version__\s*=\s*["\']([\d.]+)["\']',
-        f'__version__ = "{new_version}"',
-        content,
-    )
+    new_content = VERSION_RE.sub(f'__version__ = "{new_version}"', content)
     VERSION_FILE.write_text(new_content)
 
 
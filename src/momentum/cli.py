@@ -13,18 +13,24 @@ Usage:
     python cli.py status
 """
 
-import argparse
 import json
-import uuid
+import string
 import sys
 import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Tuple, List, Optional
 from datetime import date
 from pathlib import Path
-from momentum.timer import cmd_timer
+from types import SimpleNamespace
 import os
 
+try:
+    import orjson  # Optional: faster JSON codec, falls back to stdlib json
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 # ===== Helper for case-insensitive deduplication =====
 def merge_and_dedup_case_insensitive(list1, list2):
@@ -104,11 +110,18 @@ def safe_print(text, **kwargs):
 
 
 # ===== Styling helpers =====
+# Raw ANSI codes; always pass them through style() at the point of use so the
+# --plain flag (only known after argument parsing) is respected.
 RESET = "\033[0m"
 CYAN = "\033[96m"
 GREEN = "\033[92m"
 GRAY = "\033[90m"
 BOLD = "\033[1m"
+BOLD_CYAN = "\033[1;96m"  # BOLD + CYAN as a single sequence
+
+# A run of back-to-back SGR sequences, and the parameter list of each one
+_SGR_RUN_RE = re.compile(r"(?:\033\[[0-9;]*m){2,}")
+_SGR_PARAMS_RE = re.compile(r"\033\[([0-9;]*)m")
 
 EMOJI = {
     "added": "✅",
@@ -121,49 +134,78 @@ EMOJI = {
 }
 
 
-def style(s):
-    """Return styled text or empty string if plain mode is enabled."""
-    if USE_PLAIN:
-        return ""
+@lru_cache(maxsize=None)
+def _can_encode(text, encoding):
+    """Return True if text survives a strict encode to the given encoding."""
     try:
-        # Test if the string can be encoded safely
-        encoding = getattr(sys.stdout, "encoding", None) or "ascii"
-        s.encode(encoding, errors="strict")
-        return s
+        text.encode(encoding, errors="strict")
+        return True
     except (UnicodeEncodeError, LookupError, AttributeError):
-        # If can't encode safely, return empty
-        return ""
+        return False
 
 
-def emoji(k):
-    """Return emoji for given key or empty string if plain mode is enabled."""
-    if USE_PLAIN:
+def _stdout_encoding():
+    """Return the current stdout encoding, defaulting to ASCII."""
+    return getattr(sys.stdout, "encoding", None) or "ascii"
+
+
+def style(s):
+    """Return styled text or empty string if plain mode is enabled."""
+    if USE_PLAIN or not s:
         return ""
+    # The encodability probe is cached per (code, encoding)
+    return s if _can_encode(s, _stdout_encoding()) else ""
+
+
+def compact_sgr(text):
+    """
+    Merge adjacent ANSI SGR sequences into one, e.g. a tag's closing reset
+    followed by the row's reset, or a reset followed by the next opener.
+
+    Everything before a bare reset in a run is dropped, since the reset
+    clears it anyway.
+    """
+
+    def merge(match):
+        params = []
+        for param in _SGR_PARAMS_RE.findall(match.group(0)):
+            if param in ("", "0"):
+                params = ["0"]
+            else:
+                params.append(param)
+        return f"\033[{';'.join(params)}m"
+
+    return _SGR_RUN_RE.sub(merge, text)
+
+
+# ASCII stand-ins for consoles that can't encode the emoji above
+EMOJI_ASCII = {
+    "added": "[OK]",
+    "complete": "[DONE]",
+    "backlog_add": "[+]",
+    "backlog_list": "[-]",
+    "backlog_pull": "[>]",
+    "newday": "[NEW]",
+    "error": "[!]",
+}
 
+
+@lru_cache(maxsize=None)
+def _resolve_emoji(k, encoding):
+    """Return the emoji for k if encoding can represent it, else its ASCII stand-in."""
     emoji_char = EMOJI.get(k, "")
     if not emoji_char:
         return ""
+    return emoji_char if _can_encode(emoji_char, encoding) else EMOJI_ASCII.get(k, "")
 
-    try:
-        # Test if emoji can be encoded safely
-        encoding = getattr(sys.stdout, "encoding", None) or "ascii"
-        emoji_char.encode(encoding, errors="strict")
-        return emoji_char
-    except (UnicodeEncodeError, LookupError, AttributeError):
-        # Return ASCII alternatives in plain mode or encoding issues
-        ascii_alternatives = {
-            "added": "[OK]",
-            "complete": "[DONE]",
-            "backlog_add": "[+]",
-            "backlog_list": "[-]",
-            "backlog_pull": "[>]",
-            "newday": "[NEW]",
-            "error": "[!]",
-        }
-        return ascii_alternatives.get(k, "")
 
+def emoji(k):
+    """Return emoji for given key or empty string if plain mode is enabled."""
+    if USE_PLAIN:
+        return ""
+    # Resolution is cached per stdout encoding, so it is only probed once
+    return _resolve_emoji(k, _stdout_encoding())
 
-RESET, CYAN, GRAY, BOLD, GREEN = map(style, (RESET, CYAN, GRAY, BOLD, GREEN))
 
 # ===== Input Validation =====
 
@@ -195,6 +237,29 @@ def validate_task_name(task):
     return True, ""
 
 
+# Encodings that can represent any prompt, so the encode probe can be skipped
+_UNICODE_ENCODINGS = frozenset({"utf-8", "utf8", "utf_8", "cp65001"})
+
+
+@lru_cache(maxsize=128)
+def _can_encode_prompt(prompt, encoding):
+    """Bounded variant of _can_encode() for prompts, which may embed task text."""
+    return _can_encode.__wrapped__(prompt, encoding)
+
+
+def _console_safe_prompt(prompt):
+    """Return prompt unchanged if the console can encode it, else ASCII-replaced."""
+    encoding = _stdout_encoding()
+    if encoding.lower() in _UNICODE_ENCODINGS:
+        return prompt
+    # Most prompts are fixed strings, but some include the task name, so they
+    # get their own bounded cache rather than the unbounded style/emoji one
+    if _can_encode_prompt(prompt, encoding):
+        return prompt
+    # Fallback to ASCII-safe version
+    return prompt.encode("ascii", errors="replace").decode("ascii")
+
+
 def safe_input(prompt, validator=None):
     """
     Get user input with optional validation and Unicode safety.
@@ -207,17 +272,7 @@ def safe_input(prompt, validator=None):
         str: The validated input, or None if user cancels/validation fails
     """
     try:
-        # Make prompt safe for current console encoding
-        safe_prompt = prompt
-        try:
-            # Get encoding safely, with fallbacks
-            encoding = getattr(sys.stdout, "encoding", None) or "ascii"
-            prompt.encode(encoding, errors="strict")
-        except (UnicodeEncodeError, LookupError, AttributeError):
-            # Fallback to ASCII-safe version
-            safe_prompt = prompt.encode("ascii", errors="replace").decode("ascii")
-
-        user_input = input(safe_prompt).strip()
+        user_input = input(_console_safe_prompt(prompt)).strip()
         if validator:
             is_valid, error_msg = validator(user_input)
             if not is_valid:
@@ -242,16 +297,7 @@ def safe_int_input(prompt, min_val=None, max_val=None):
         int or None: The validated integer, or None if invalid/cancelled
     """
     try:
-        # Make prompt safe for current console encoding
-        safe_prompt = prompt
-        try:
-            # Get encoding safely, with fallbacks
-            encoding = getattr(sys.stdout, "encoding", None) or "ascii"
-            prompt.encode(encoding, errors="strict")
-        except (UnicodeEncodeError, LookupError, AttributeError):
-            safe_prompt = prompt.encode("ascii", errors="replace").decode("ascii")
-
-        user_input = input(safe_prompt).strip()
+        user_input = input(_console_safe_prompt(prompt)).strip()
         if not user_input:
             return None
 
@@ -301,18 +347,103 @@ def migrate_task_data(data: dict) -> bool:
     return migrated
 
 
+def encode_storage(data) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON bytes, using orjson when installed.
+
+    No indentation or padding: the file is rewritten and re-parsed on every
+    command, so whitespace is pure overhead there.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode(Config.STORAGE_ENCODING)
+
+
+def decode_storage(payload: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# O_CLOEXEC/O_NOCTTY are POSIX-only and O_BINARY is Windows-only
+_READ_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_NOCTTY", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
+
+def _read_storage(path):
+    """
+    Read a whole file with raw os-level calls; return (bytes, fstat result).
+
+    Bypasses the buffered io.open() stack (and its isatty probe), which is
+    pure overhead for a small regular file read once per command.
+    """
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        st = os.fstat(fd)
+        chunks = []
+        while True:
+            # Read one byte past the reported size so a growing file is noticed
+            chunk = os.read(fd, max(st.st_size, 4096) + 1)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks), st
+    finally:
+        os.close(fd)
+
+
+# (path, mtime_ns, size, payload) of the storage bytes last read or written
+_last_stored = None
+
+
+def _remember_stored(payload, st):
+    """
+    Record payload as the current contents of STORE.
+
+    ``st`` is the fstat taken while the file was open for the read or write,
+    so no extra stat call is needed here.
+    """
+    global _last_stored
+    _last_stored = (STORE, st.st_mtime_ns, st.st_size, payload)
+
+
+def _store_already_holds(payload):
+    """
+    Return True if STORE is known to contain exactly payload.
+
+    The stat check makes sure the file was not touched by another process
+    since it was last read or written here.
+    """
+    if _last_stored is None:
+        return False
+    path, mtime_ns, size, stored = _last_stored
+    if path != STORE or stored != payload:
+        return False
+    try:
+        st = os.stat(STORE)
+    except OSError:
+        return False
+    return st.st_mtime_ns == mtime_ns and st.st_size == size
+
+
 def load():
     """Load data from storage file, returning empty dict if file doesn't exist."""
     try:
-        if STORE.exists():
-            content = STORE.read_text(encoding=Config.STORAGE_ENCODING)
-            data = json.loads(content)
-            if migrate_task_data(data):
-                save(data)  # Save migrated data
-            return data
-        else:
-            return {}
-    except json.JSONDecodeError as e:
+        # Decode straight from UTF-8 bytes, skipping the text-mode decode
+        payload, st = _read_storage(STORE)
+        data = decode_storage(payload)
+        _remember_stored(payload, st)
+        if migrate_task_data(data):
+            save(data)  # Save migrated data
+        return data
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         safe_print(f"{emoji('error')} Storage file corrupted: {e}")
         safe_print("Creating backup and starting fresh...")
         # Create backup of corrupted file
@@ -328,13 +459,66 @@ def load():
         return {}
 
 
-def save(data):
-    """Save data to storage file with UTF-8 encoding and error handling."""
+def _fsync_directory(directory):
+    """
+    Flush a directory entry to disk so a rename inside it survives a crash.
+
+    Best effort and POSIX-only: the data itself is already in place, so a
+    failure here is not reported as a failed save.
+    """
+    if os.name != "posix":
+        return
     try:
-        content = json.dumps(data, indent=2)
-        STORE.write_text(content, encoding=Config.STORAGE_ENCODING)
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def save(data, *, durable=False):
+    """
+    Save data to storage file with UTF-8 encoding and error handling.
+
+    The payload is written to a sibling temp file and moved over the store with
+    os.replace, so an interrupted write can never leave a truncated storage file.
+
+    Args:
+        data: The full storage dict to write.
+        durable: If True, fsync the temp file before the rename, and the
+            directory after it, so the change survives a power loss. Reserved
+            for user-visible mutations (adding, completing, pulling, removing
+            or cancelling tasks); housekeeping writes such as migrations and
+            newday skip the extra flushes.
+
+    Returns:
+        bool: True if the data was written (or the store already held
+        exactly these bytes), False otherwise.
+    """
+    tmp_path = STORE.with_name(STORE.name + ".tmp")
+    try:
+        payload = encode_storage(data)
+        if _store_already_holds(payload):
+            return True
+        with open(tmp_path, "wb") as fh:
+            fh.write(payload)
+            fh.flush()
+            if durable:
+                os.fsync(fh.fileno())
+            # os.replace keeps the inode, so this is the stored file's stat too
+            st = os.fstat(fh.fileno())
+        os.replace(tmp_path, STORE)
+        if durable:
+            _fsync_directory(STORE.parent)
+        _remember_stored(payload, st)
         return True
     except (OSError, PermissionError) as e_os:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         safe_print(f"{emoji('error')} Cannot save to storage file: {e_os}")
         safe_print("Changes will be lost when the program exits.")
         return False
@@ -343,26 +527,69 @@ def save(data):
         return False
 
 
+# Seconds a looked-up system date is reused; short enough that a process
+# left running past midnight still notices the new day
+_TODAY_TTL = 60.0
+_today_cache = [None, 0.0]  # [YYYY-MM-DD, time.monotonic() of the lookup]
+
+
+def _system_today_key():
+    """Return the system date as YYYY-MM-DD, re-read at most every _TODAY_TTL."""
+    now = time.monotonic()
+    key, looked_up = _today_cache
+    if key is None or now - looked_up >= _TODAY_TTL:
+        key = date.today().isoformat()
+        _today_cache[:] = [key, now]
+    return key
+
+
+def _clear_today_cache():
+    """Forget the cached system date so the next lookup re-reads it."""
+    _today_cache[:] = [None, 0.0]
+
+
 def today_key():
     """Return today's date as a string in YYYY-MM-DD format."""
     env_date = os.environ.get("MOMENTUM_TODAY_KEY")
     if env_date:
         return env_date
-    return str(date.today())
+    return _system_today_key()
+
+
+def now_timestamp():
+    """Return the current local time as an ISO-8601 string with seconds precision."""
+    return datetime.now().isoformat(timespec="seconds")
 
 
 def ensure_today(data):
-    """Ensure today's date exists in data with proper structure and return today's data."""
+    """
+    Ensure today's date exists in data with proper structure and return today's data.
+
+    Also guarantees ``data["backlog"]`` exists, so callers can index it directly.
+    """
     # Ensure global backlog exists
     if "backlog" not in data:
         data["backlog"] = []
 
-    # Ensure today's entry exists
-    today = data.setdefault(today_key(), {"todo": None, "done": []})
+    # Ensure today's entry exists; only build the empty template on a miss
+    key = today_key()
+    today = data.get(key)
+    if today is None:
+        today = data[key] = {"todo": None, "done": []}
 
     return today
 
 
+def peek_today(data):
+    """
+    Return today's data without modifying ``data``.
+
+    For read-only callers such as status: a missing day is reported as an
+    empty one instead of being inserted.
+    """
+    return data.get(today_key()) or {"todo": None, "done": []}
+
+
 def get_backlog(data):
     """Get the global backlog, creating it if it doesn't exist."""
     return data.setdefault("backlog", [])
@@ -373,65 +600,91 @@ def get_backlog(data):
 
 def format_backlog_timestamp(ts):
     """Format timestamp for display in backlog listings."""
+    if (
+        ts
+        and len(ts) >= 16
+        and ts[4] == ts[7] == "-"
+        and ts[10] == "T"
+        and ts[13] == ":"
+        and Config.DATE_FORMAT == "%m/%d"
+        and Config.TIME_FORMAT == "%H:%M"
+    ):
+        # Stored timestamps are ISO-8601, so the default "[MM/DD HH:MM]" can be
+        # sliced out without building a datetime and calling strftime twice
+        return f"[{ts[5:7]}/{ts[8:10]} {ts[11:16]}]"
     try:
         dt = datetime.fromisoformat(ts)
-        date_str = dt.strftime(Config.DATE_FORMAT)
-        time_str = dt.strftime(Config.TIME_FORMAT)
-        return f"[{date_str} {time_str}]"
+        # One strftime over the joined formats instead of one per part
+        return f"[{dt.strftime(f'{Config.DATE_FORMAT} {Config.TIME_FORMAT}')}]"
     except (ValueError, KeyError):
         return f"[{ts if ts else 'no timestamp'}]"
 
 
+def task_view(item):
+    """
+    Normalize any stored task layout for display.
+
+    Handles structured tasks (top-level categories/tags), done/backlog
+    wrappers around a nested task dict, legacy ``{"task": "text"}`` items and
+    bare strings. Categories and tags from stored fields and from the text
+    itself are merged, and any that the text doesn't mention are appended.
+
+    Returns:
+        tuple: (task_text, categories, tags, display_text)
+    """
+    field_categories = []
+    field_tags = []
+    if isinstance(item, dict):
+        # Always check for top-level fields first
+        if "categories" in item or "tags" in item:
+            field_categories = item.get("categories", [])
+            field_tags = item.get("tags", [])
+            task_text = item.get("task", "")
+        elif "task" in item:
+            if isinstance(item["task"], dict):
+                task_text = item["task"]["task"]
+                field_categories = item["task"].get("categories", [])
+                field_tags = item["task"].get("tags", [])
+            else:
+                task_text = item["task"]
+        else:
+            task_text = str(item)
+    else:
+        task_text = str(item)
+    _, text_categories, text_tags = parse_tags(task_text)
+    categories = merge_and_dedup_case_insensitive(field_categories, text_categories)
+    tags = merge_and_dedup_case_insensitive(field_tags, text_tags)
+
+    display_text = task_text
+    for cat in categories:
+        if not any(
+            f"@{cat.lower()}" == part.lower()
+            for part in display_text.split()
+            if part.startswith("@")
+        ):
+            display_text += f" @{cat}"
+    for tag in tags:
+        if not any(
+            f"#{tag.lower()}" == part.lower()
+            for part in display_text.split()
+            if part.startswith("#")
+        ):
+            display_text += f" #{tag}"
+    return task_text, categories, tags, display_text.strip()
+
+
 def print_backlog_list(backlog, title="Backlog"):
     """Print formatted backlog with consistent styling and tag highlighting."""
-    safe_print(f"{emoji('backlog_list')} {title}:")
+    # Rows are collected and written with a single print call
+    lines = [f"{emoji('backlog_list')} {title}:"]
     for i, item in enumerate(backlog, 1):
         timestamp = format_backlog_timestamp(item.get("ts", ""))
-        task_text = ""
-        field_categories = []
-        field_tags = []
-        if isinstance(item, dict):
-            # Always check for top-level fields first
-            if "categories" in item or "tags" in item:
-                field_categories = item.get("categories", [])
-                field_tags = item.get("tags", [])
-                task_text = item.get("task", "")
-            elif "task" in item:
-                if isinstance(item["task"], dict):
-                    task_text = item["task"]["task"]
-                    field_categories = item["task"].get("categories", [])
-                    field_tags = item["task"].get("tags", [])
-                else:
-                    task_text = item["task"]
-                    _, field_categories, field_tags = parse_tags(task_text)
-            else:
-                task_text = str(item)
-        else:
-            task_text = str(item)
-            _, field_categories, field_tags = parse_tags(task_text)
-        _, text_categories, text_tags = parse_tags(task_text)
-        categories = merge_and_dedup_case_insensitive(field_categories, text_categories)
-        tags = merge_and_dedup_case_insensitive(field_tags, text_tags)
-        display_text = task_text
-        for cat in categories:
-            if not any(
-                f"@{cat.lower()}" == part.lower()
-                for part in display_text.split()
-                if part.startswith("@")
-            ):
-                display_text += f" @{cat}"
-        for tag in tags:
-            if not any(
-                f"#{tag.lower()}" == part.lower()
-                for part in display_text.split()
-                if part.startswith("#")
-            ):
-                display_text += f" #{tag}"
-        display_text = display_text.strip()
+        _, categories, tags, display_text = task_view(item)
         formatted_task = format_task_with_tags(
             display_text, categories, tags, USE_PLAIN
         )
-        safe_print(f" {i}. {formatted_task} {timestamp}")
+        lines.append(f" {i}. {formatted_task} {timestamp}")
+    safe_print("\n".join(lines))
 
 
 def complete_current_task(today):
@@ -448,9 +701,9 @@ def complete_current_task(today):
         task_data["state"] = "done"
     # Store complete task data in done list
     done_item = {
-        "id": uuid.uuid4().hex[:8],
+        "id": os.urandom(4).hex(),
         "task": task_data,  # Store full task data structure
-        "ts": datetime.now().isoformat(timespec="seconds"),
+        "ts": now_timestamp(),
     }
     today["done"].append(done_item)
     safe_print(f"{emoji('complete')} Completed: {repr(task_text)}")
@@ -458,7 +711,11 @@ def complete_current_task(today):
 
 
 def handle_next_task_selection(data, today):
-    """Handle user selection of next task after completing current one."""
+    """
+    Handle user selection of next task after completing current one.
+
+    Only mutates ``data``; the caller is responsible for saving it.
+    """
     backlog = get_backlog(data)
 
     # Show current backlog
@@ -468,10 +725,13 @@ def handle_next_task_selection(data, today):
     else:
         safe_print("\nBacklog is empty.")
 
-    safe_print("\nSelect next task:")
-    safe_print(" - Enter a number to pull from backlog")
-    safe_print(" - [n] Add a new task")
-    safe_print(" - [Enter] to skip")
+    # Emit the menu as one write rather than four
+    safe_print(
+        "\nSelect next task:\n"
+        " - Enter a number to pull from backlog\n"
+        " - [n] Add a new task\n"
+        " - [Enter] to skip"
+    )
 
     choice = safe_input("> ")
     if choice is None:
@@ -482,40 +742,46 @@ def handle_next_task_selection(data, today):
         if 0 <= index < len(backlog):
             task_item = backlog.pop(index)
 
-            # Handle different backlog item formats
-            if isinstance(task_item, dict) and "task" in task_item:
-                if isinstance(task_item["task"], dict):
-                    # New structured format
-                    today["todo"] = task_item["task"]
-                    task_text = task_item["task"]["task"]
-                else:
-                    # Old format
-                    task_text = task_item["task"]
-                    today["todo"] = create_task_data(task_text)
-            else:
-                # Very old format
-                task_text = str(task_item)
-                today["todo"] = create_task_data(task_text)
+            today["todo"] = backlog_item_task(task_item)
+            task_text = today["todo"]["task"]
 
-            if save(data):
-                safe_print(
-                    f"{emoji('backlog_pull')} Pulled from backlog: {repr(task_text)}"
-                )
-                cmd_status(None)  # Show status after pulling
+            safe_print(
+                f"{emoji('backlog_pull')} Pulled from backlog: {repr(task_text)}"
+            )
+            cmd_status(None, data=data)  # Show status after pulling
         else:
             safe_print(f"{emoji('error')} Invalid backlog index.")
     elif choice.lower() == "n":
         new_task = safe_input("Enter new task: ", validate_task_name)
         if new_task:
             today["todo"] = create_task_data(new_task)  # Use structured data
-            if save(data):
-                safe_print(f"{emoji('added')} Added: {repr(new_task)}")
-                cmd_status(None)  # Show status after adding
+            safe_print(f"{emoji('added')} Added: {repr(new_task)}")
+            cmd_status(None, data=data)  # Show status after adding
     # Empty choice (Enter) - skip, no action needed
 
 
 # ===== Tag Parsing Functions =====
 
+# Compiled once at import; these run for every task that is parsed or shown
+CATEGORY_RE = re.compile(r"@([a-zA-Z0-9_-]+)")
+TAG_RE = re.compile(r"#([a-zA-Z0-9_-]+)")
+# Characters allowed in a category or tag name
+ALLOWED_TAG_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+# Any @category or #tag token, with the sigil and the name as groups
+TAG_TOKEN_RE = re.compile(r"([@#])([a-zA-Z0-9_-]+)")
+
+
+def _dedup_lower(names):
+    """Lowercase names and drop repeats, keeping first-seen order."""
+    seen = set()
+    result = []
+    for name in names:
+        key = name.lower()
+        if key not in seen:
+            seen.add(key)
+            result.append(key)
+    return result
+
 
 def parse_tags(task_text: str) -> Tuple[str, List[str], List[str]]:
     """
@@ -537,19 +803,27 @@ def parse_tags(task_text: str) -> Tuple[str, List[str], List[str]]:
     if not task_text:
         return task_text, [], []
 
-    # Regular expressions for matching tags
-    category_pattern = r"@([a-zA-Z0-9_-]+)"
-    tag_pattern = r"#([a-zA-Z0-9_-]+)"
+    # Most tasks carry no tags; a substring check is cheaper than two regex scans
+    if "@" not in task_text and "#" not in task_text:
+        return task_text, [], []
 
-    # Find all categories and tags
-    categories = re.findall(category_pattern, task_text)
-    tags = re.findall(tag_pattern, task_text)
+    # Fresh lists every call, so callers may mutate them without touching the cache
+    categories, tags = _scan_tags(task_text)
+    return task_text, list(categories), list(tags)
 
-    # Normalize to lowercase and remove duplicates while preserving order
-    categories = list(dict.fromkeys(cat.lower() for cat in categories))
-    tags = list(dict.fromkeys(tag.lower() for tag in tags))
 
-    return task_text, categories, tags
+@lru_cache(maxsize=4096)
+def _scan_tags(task_text):
+    """
+    Find the lowercase, deduplicated categories and tags in task_text.
+
+    Memoized: the same task strings are parsed again on every status,
+    backlog and filter render.
+    """
+    # Normalize to lowercase and remove duplicates while preserving order
+    categories = _dedup_lower(CATEGORY_RE.findall(task_text))
+    tags = _dedup_lower(TAG_RE.findall(task_text))
+    return tuple(categories), tuple(tags)
 
 
 def validate_tag_format(tag: str) -> bool:
@@ -574,12 +848,15 @@ def validate_tag_format(tag: str) -> bool:
         return False
 
     # Only allow alphanumeric, underscore, and hyphen
-    pattern = r"^[a-zA-Z0-9_-]+$"
-    return bool(re.match(pattern, tag))
+    return ALLOWED_TAG_CHARS.issuperset(tag)
 
 
 def format_task_with_tags(
-    task_text: str, categories: List[str], tags: List[str], plain_mode: bool = False
+    task_text: str,
+    categories: List[str],
+    tags: List[str],
+    plain_mode: bool = False,
+    row_style: str = "",
 ) -> str:
     """
     Format task text with highlighted categories and tags.
@@ -589,40 +866,31 @@ def format_task_with_tags(
         categories: List of categories found in the task
         tags: List of tags found in the task
         plain_mode: If True, don't add color codes
+        row_style: Escape code of the surrounding row, re-applied after each tag
 
     Returns:
         str: Formatted task text with highlighted tags
     """
-    if plain_mode or USE_PLAIN:
-        # In plain mode, just return the original text
+    if plain_mode or USE_PLAIN or not (categories or tags):
+        # In plain mode, or with nothing to highlight, return the original text
         return task_text
 
     # Color codes for highlighting
-    CATEGORY_COLOR = "\033[94m"  # Blue
-    TAG_COLOR = "\033[93m"  # Yellow
-    RESET_COLOR = "\033[0m"
+    colors = {"@": "\033[94m", "#": "\033[93m"}  # Blue categories, yellow tags
+    reset_color = "\033[0m"
+    wanted = {
+        "@": {category.lower() for category in categories},
+        "#": {tag.lower() for tag in tags},
+    }
 
-    formatted_text = task_text
+    def highlight(match):
+        sigil, name = match.groups()
+        if name.lower() not in wanted[sigil]:
+            return match.group(0)
+        return f"{colors[sigil]}{match.group(0)}{reset_color}{row_style}"
 
-    # Highlight categories (@category)
-    for category in categories:
-        replacement = f"{CATEGORY_COLOR}@{category}{RESET_COLOR}"
-        # Use word boundaries to avoid partial matches
-        formatted_text = re.sub(
-            f"@{re.escape(category)}\\\\b",
-            replacement,
-            formatted_text,
-            flags=re.IGNORECASE,
-        )
-
-    # Highlight tags (#tag)
-    for tag in tags:
-        replacement = f"{TAG_COLOR}#{tag}{RESET_COLOR}"
-        formatted_text = re.sub(
-            f"#{re.escape(tag)}\\\\b", replacement, formatted_text, flags=re.IGNORECASE
-        )
-
-    return formatted_text
+    # One scan over the text for every category and tag
+    return TAG_TOKEN_RE.sub(highlight, task_text)
 
 
 def create_task_data(task_text: str) -> dict:
@@ -638,11 +906,32 @@ def create_task_data(task_text: str) -> dict:
         "task": text,
         "categories": categories,
         "tags": tags,
-        "ts": datetime.now().isoformat(timespec="seconds"),
+        "ts": now_timestamp(),
         "state": "active",
     }
 
 
+def backlog_item_text(item) -> str:
+    """Return the task text of a backlog item in any stored layout."""
+    if isinstance(item, dict) and "task" in item:
+        task = item["task"]
+        return task["task"] if isinstance(task, dict) else task
+    return str(item)
+
+
+def backlog_item_task(item) -> dict:
+    """
+    Return the structured task held by a backlog item in any stored layout.
+
+    Items wrapping a task dict hand it back as-is; legacy items that only
+    carry text (``{"task": "text"}`` or a bare string) get a new task built
+    from that text.
+    """
+    if isinstance(item, dict) and isinstance(item.get("task"), dict):
+        return item["task"]
+    return create_task_data(backlog_item_text(item))
+
+
 # ===== Update existing validation function =====
 
 
@@ -661,6 +950,10 @@ def validate_task_name_with_tags(task: str) -> Tuple[bool, str]:
     if not is_valid:
         return is_valid, error_msg
 
+    # Without a sigil there are no tags to validate
+    if "@" not in task and "#" not in task:
+        return True, ""
+
     # Parse and validate tags
     text, categories, tags = parse_tags(task)
 
@@ -686,39 +979,43 @@ def validate_task_name_with_tags(task: str) -> Tuple[bool, str]:
 # ===== Helper functions for filtering (we'll implement these next) =====
 
 
-def extract_categories_from_tasks(tasks: List[dict]) -> List[str]:
-    """Extract all unique categories from a list of tasks."""
+def extract_categories_and_tags(tasks: List[dict]) -> Tuple[List[str], List[str]]:
+    """
+    Extract all unique categories and tags from a list of tasks in one pass.
+
+    Returns:
+        tuple: (sorted categories, sorted tags)
+    """
     categories = set()
+    tags = set()
     for task in tasks:
         if isinstance(task, dict):
-            if "categories" in task:
-                categories.update(task["categories"])
+            categories.update(task.get("categories", ()))
+            tags.update(task.get("tags", ()))
             if "task" in task:
                 if isinstance(task["task"], dict):
                     # Handle nested task dictionary
-                    if "categories" in task["task"]:
-                        categories.update(task["task"]["categories"])
-                    if "task" in task["task"]:
-                        _, cats, _ = parse_tags(task["task"]["task"])
-                        categories.update(cats)
+                    categories.update(task["task"].get("categories", ()))
+                    tags.update(task["task"].get("tags", ()))
+                    text = task["task"].get("task")
                 else:
-                    # Handle legacy tasks without category field
-                    _, cats, _ = parse_tags(task["task"])
+                    # Handle legacy tasks without category/tag fields
+                    text = task["task"]
+                if text:
+                    _, cats, task_tags = parse_tags(text)
                     categories.update(cats)
-    return sorted(list(categories))
+                    tags.update(task_tags)
+    return sorted(categories), sorted(tags)
+
+
+def extract_categories_from_tasks(tasks: List[dict]) -> List[str]:
+    """Extract all unique categories from a list of tasks."""
+    return extract_categories_and_tags(tasks)[0]
 
 
 def extract_tags_from_tasks(tasks: List[dict]) -> List[str]:
     """Extract all unique tags from a list of tasks."""
-    tags = set()
-    for task in tasks:
-        if isinstance(task, dict) and "tags" in task:
-            tags.update(task["tags"])
-        elif isinstance(task, dict) and "task" in task:
-            # Handle legacy tasks without tags field
-            _, _, task_tags = parse_tags(task["task"])
-            tags.update(task_tags)
-    return sorted(list(tags))
+    return extract_categories_and_tags(tasks)[1]
 
 
 def filter_tasks(
@@ -740,6 +1037,8 @@ def filter_tasks(
     if not filter_categories and not filter_tags:
         return tasks
 
+    category_filter = frozenset(filter_categories or ())
+    tag_filter = frozenset(filter_tags or ())
     filtered_tasks = []
 
     for task in tasks:
@@ -753,12 +1052,12 @@ def filter_tasks(
                 _, task_categories, task_tags = parse_tags(task.get("task", ""))
 
             # Check if task matches category filter
-            category_match = not filter_categories or any(
-                cat in task_categories for cat in filter_categories
+            category_match = not category_filter or not category_filter.isdisjoint(
+                task_categories
             )
 
             # Check if task matches tag filter
-            tag_match = not filter_tags or any(tag in task_tags for tag in filter_tags)
+            tag_match = not tag_filter or not tag_filter.isdisjoint(task_tags)
 
             # Task must match both filters (if specified)
             if category_match and tag_match:
@@ -862,10 +1161,10 @@ def filter_tasks_by_tags_or_categories(
 ) -> List[dict]:
     if not filter_categories and not filter_tags:
         return tasks
-    normalized_filter_categories = (
-        [cat.lower() for cat in filter_categories] if filter_categories else []
+    normalized_filter_categories = frozenset(
+        cat.lower() for cat in filter_categories or ()
     )
-    normalized_filter_tags = [tag.lower() for tag in filter_tags] if filter_tags else []
+    normalized_filter_tags = frozenset(tag.lower() for tag in filter_tags or ())
     filtered_tasks = []
     for task_item in tasks:
         task_text = ""
@@ -904,11 +1203,11 @@ def filter_tasks_by_tags_or_categories(
             tag.lower()
             for tag in merge_and_dedup_case_insensitive(field_tags, text_tags)
         ]
-        category_match = not normalized_filter_categories or any(
-            cat in normalized_filter_categories for cat in merged_categories
+        category_match = not normalized_filter_categories or (
+            not normalized_filter_categories.isdisjoint(merged_categories)
         )
-        tag_match = not normalized_filter_tags or any(
-            tag in normalized_filter_tags for tag in merged_tags
+        tag_match = not normalized_filter_tags or (
+            not normalized_filter_tags.isdisjoint(merged_tags)
         )
         if normalized_filter_categories and normalized_filter_tags:
             if category_match and tag_match:
@@ -922,15 +1221,35 @@ def filter_tasks_by_tags_or_categories(
     return filtered_tasks
 
 
+def view_matches_filter(categories, tags, category_filter, tag_filter) -> bool:
+    """
+    Check a task's already-merged categories and tags against filter sets.
+
+    Args:
+        categories: Categories from task_view()
+        tags: Tags from task_view()
+        category_filter: Lowercase categories to match (empty means any)
+        tag_filter: Lowercase tags to match (empty means any)
+
+    Returns:
+        bool: True if every non-empty filter shares at least one name
+    """
+    if category_filter and category_filter.isdisjoint(
+        cat.lower() for cat in categories
+    ):
+        return False
+    return not tag_filter or not tag_filter.isdisjoint(tag.lower() for tag in tags)
+
+
 def filter_single_task_by_tags_or_categories(
     task,
     filter_categories: Optional[List[str]] = None,
     filter_tags: Optional[List[str]] = None,
 ) -> bool:
-    normalized_filter_categories = (
-        [cat.lower() for cat in filter_categories] if filter_categories else []
+    normalized_filter_categories = frozenset(
+        cat.lower() for cat in filter_categories or ()
     )
-    normalized_filter_tags = [tag.lower() for tag in filter_tags] if filter_tags else []
+    normalized_filter_tags = frozenset(tag.lower() for tag in filter_tags or ())
     if not normalized_filter_categories and not normalized_filter_tags:
         return True
     task_text = ""
@@ -965,11 +1284,11 @@ def filter_single_task_by_tags_or_categories(
     merged_tags = [
         tag.lower() for tag in merge_and_dedup_case_insensitive(field_tags, text_tags)
     ]
-    category_match = not normalized_filter_categories or any(
-        cat in normalized_filter_categories for cat in merged_categories
+    category_match = not normalized_filter_categories or (
+        not normalized_filter_categories.isdisjoint(merged_categories)
     )
-    tag_match = not normalized_filter_tags or any(
-        tag in normalized_filter_tags for tag in merged_tags
+    tag_match = not normalized_filter_tags or (
+        not normalized_filter_tags.isdisjoint(merged_tags)
     )
     if normalized_filter_categories and normalized_filter_tags:
         return category_match and tag_match
@@ -1017,7 +1336,7 @@ def create_done_item(task_data: dict) -> dict:
         dict: A structured item for the 'done' list.
     """
     return {
-        "id": uuid.uuid4().hex[:8],  # Generate a new ID for the done entry
+        "id": os.urandom(4).hex(),  # Generate a new ID for the done entry
         "task": task_data,  # This is the task dict itself (which includes its original ts, state, etc.)
         "ts": datetime.now().isoformat(),  # Timestamp of completion/cancellation for this 'done' record
     }
@@ -1100,10 +1419,9 @@ def cmd_add(args):
             f"{prompt_char} Would you like to add '{clean_task}' to the backlog instead? [y/N]: "
         )
         if response and response.lower() == "y":
-            get_backlog(data).append(
-                task_data
-            )  # Use task_data instead of separate dict
-            if save(data):
+            # ensure_today() above guarantees the backlog exists
+            data["backlog"].append(task_data)  # Use task_data instead of separate dict
+            if save(data, durable=True):
                 safe_print(
                     f"{emoji('backlog_add')} Added to backlog: {repr(clean_task)}"
                 )
@@ -1111,9 +1429,9 @@ def cmd_add(args):
 
     # Store the full task data structure instead of just text
     today["todo"] = task_data
-    if save(data):
+    if save(data, durable=True):
         safe_print(f"{emoji('added')} Added: {clean_task}")
-        cmd_status(args)
+        cmd_status(args, data=data)
 
 
 def cmd_done(args):
@@ -1127,24 +1445,31 @@ def cmd_done(args):
 
     # Complete the task
     complete_current_task(today)
-    if not save(data):
-        return  # Don't proceed if save failed
+    try:
+        cmd_status(args, data=data)
 
-    cmd_status(args)
+        # Handle next task selection
+        handle_next_task_selection(data, today)
+    finally:
+        # Single write for the completion plus any pull/add that followed it
+        save(data, durable=True)
 
-    # Handle next task selection
-    handle_next_task_selection(data, today)
 
+def cmd_status(args, *, data=None):
+    """
+    Display current status showing completed tasks and active task.
 
-def cmd_status(args):
-    """Display current status showing completed tasks and active task."""
+    Commands that already hold the loaded data (e.g. right after a mutation)
+    pass it as ``data`` so the storage file is not read and parsed twice.
+    """
     global USE_PLAIN, STORE
     if hasattr(args, "plain"):
         USE_PLAIN = args.plain
     if hasattr(args, "store") and args.store:
         STORE = Path(args.store)
-    data = load()
-    today = ensure_today(data)
+    if data is None:
+        data = load()
+    today = peek_today(data)
     today_str = today_key()
 
     # Parse filter if provided
@@ -1170,127 +1495,72 @@ def cmd_status(args):
             parts.append(formatted_tags)
         filter_info = f" (filtered by: {', '.join(parts)})"
 
-    safe_print(f"\n=== TODAY: {today_str}{filter_info} ===")
-
-    # Filter and display completed tasks
-    completed_tasks = today["done"]
-    if filter_categories or filter_tags:  # Check both
-        completed_tasks = filter_tasks_by_tags_or_categories(
-            completed_tasks, filter_categories, filter_tags
-        )  # Pass tags
-
-    if completed_tasks:
-        for it in completed_tasks:
-            ts = it["ts"].split("T")[1]
-            if isinstance(it["task"], dict):
-                task_text = it["task"]["task"]
-                field_categories = it["task"].get("categories", [])
-                field_tags = it["task"].get("tags", [])
-            else:
-                task_text = it["task"]
-                _, field_categories, field_tags = parse_tags(task_text)
-            _, text_categories, text_tags = parse_tags(task_text)
-            categories = merge_and_dedup_case_insensitive(
-                field_categories, text_categories
-            )
-            tags = merge_and_dedup_case_insensitive(field_tags, text_tags)
-            display_text = task_text
-            for cat in categories:
-                if not any(
-                    f"@{cat.lower()}" == part.lower()
-                    for part in display_text.split()
-                    if part.startswith("@")
-                ):
-                    display_text += f" @{cat}"
-            for tag in tags:
-                if not any(
-                    f"#{tag.lower()}" == part.lower()
-                    for part in display_text.split()
-                    if part.startswith("#")
-                ):
-                    display_text += f" #{tag}"
-            display_text = display_text.strip()
+    # Collect the report and write it in one go rather than line by line
+    lines = [f"\n=== TODAY: {today_str}{filter_info} ==="]
+
+    # Filters are already lowercased by parse_filter_string
+    category_filter = frozenset(filter_categories)
+    tag_filter = frozenset(filter_tags)
+
+    # Parse each completed task once and filter on that same view, rather
+    # than parsing it again inside filter_tasks_by_tags_or_categories
+    completed_views = []
+    for it in today["done"]:
+        view = task_view(it)
+        if view_matches_filter(view[1], view[2], category_filter, tag_filter):
+            completed_views.append((it, view))
+
+    if completed_views:
+        # Resolve styling once per render; style() returns "" in plain mode, so
+        # the same row template serves both plain and colour output.
+        done_prefix = style(GREEN)
+        done_suffix = style(RESET)
+        for it, (_, categories, tags, display_text) in completed_views:
+            # Done timestamps are ISO-8601 ("YYYY-MM-DDTHH:MM:SS[.ffffff]"), so
+            # HH:MM:SS is always at [11:19]; older entries may carry microseconds
+            ts = it["ts"][11:19]
             formatted_task = format_task_with_tags(
-                display_text, categories, tags, USE_PLAIN
+                display_text, categories, tags, USE_PLAIN, done_prefix
             )
-            if USE_PLAIN:
-                safe_print(display_text + f" [{ts}]")
-            else:
-                safe_print(f"{style(GREEN)}{formatted_task}{style(RESET)} [{ts}]")
+            lines.append(f"{done_prefix}{formatted_task}{done_suffix} [{ts}]")
     else:
         if filter_categories or filter_tags:
-            safe_print("No completed tasks match the filter.")
+            lines.append("No completed tasks match the filter.")
         else:
-            safe_print("No completed tasks yet.")
+            lines.append("No completed tasks yet.")
 
     # Display active task (if it matches filter)
     if today["todo"]:
-        if isinstance(today["todo"], dict):
-            # Always check for top-level fields first
-            if "categories" in today["todo"] or "tags" in today["todo"]:
-                field_categories = today["todo"].get("categories", [])
-                field_tags = today["todo"].get("tags", [])
-                task_text = today["todo"].get("task", "")
-            elif "task" in today["todo"]:
-                if isinstance(today["todo"]["task"], dict):
-                    task_text = today["todo"]["task"]["task"]
-                    field_categories = today["todo"]["task"].get("categories", [])
-                    field_tags = today["todo"]["task"].get("tags", [])
-                else:
-                    task_text = today["todo"]["task"]
-                    _, field_categories, field_tags = parse_tags(task_text)
-            else:
-                task_text = str(today["todo"])
-        else:
-            task_text = today["todo"]
-            _, field_categories, field_tags = parse_tags(task_text)
-        _, text_categories, text_tags = parse_tags(task_text)
-        categories = merge_and_dedup_case_insensitive(field_categories, text_categories)
-        tags = merge_and_dedup_case_insensitive(field_tags, text_tags)
-        matches_filter = True
-        if filter_categories or filter_tags:
-            matches_filter = filter_single_task_by_tags_or_categories(
-                today["todo"], filter_categories, filter_tags
-            )
-        if matches_filter:
-            display_text = task_text
-            for cat in categories:
-                if not any(
-                    f"@{cat.lower()}" == part.lower()
-                    for part in display_text.split()
-                    if part.startswith("@")
-                ):
-                    display_text += f" @{cat}"
-            for tag in tags:
-                if not any(
-                    f"#{tag.lower()}" == part.lower()
-                    for part in display_text.split()
-                    if part.startswith("#")
-                ):
-                    display_text += f" #{tag}"
-            display_text = f"{display_text.strip()}"
+        _, categories, tags, display_text = task_view(today["todo"])
+        if view_matches_filter(categories, tags, category_filter, tag_filter):
             formatted_task = format_task_with_tags(
-                display_text, categories, tags, USE_PLAIN
+                display_text, categories, tags, USE_PLAIN, style(BOLD_CYAN)
             )
             if USE_PLAIN:
-                safe_print(display_text)
+                lines.append(display_text)
             else:
-                safe_print(f"{style(BOLD+CYAN)}{formatted_task}{style(RESET)}")
+                lines.append(f"{style(BOLD_CYAN)}{formatted_task}{style(RESET)}")
         else:
-            safe_print(f"{style(GRAY)}No active task matches filter{style(RESET)}")
-            safe_print("=" * (17 + len(today_str) + len(filter_info)))
-            return  # Do not print TBD if no active task matches filter
+            lines.append(f"{style(GRAY)}No active task matches filter{style(RESET)}")
     else:
-        safe_print(f"{style(GRAY)}TBD{style(RESET)}")
+        lines.append(f"{style(GRAY)}TBD{style(RESET)}")
 
-    safe_print("=" * (17 + len(today_str) + len(filter_info)))
+    lines.append("=" * (17 + len(today_str) + len(filter_info)))
+    output = "\n".join(lines)
+    if not USE_PLAIN:
+        # Tag highlights end in a reset right before the row's own reset
+        output = compact_sgr(output)
+    safe_print(output)
 
 
 def cmd_newday(args):
     """Initialize a new day's data structure."""
     data = load()
+    # ensure_today() only ever adds keys, so an unchanged count means there is
+    # nothing new to write
+    key_count = len(data)
     ensure_today(data)
-    if save(data):
+    if len(data) == key_count or save(data):
         safe_print(f"{emoji('newday')} New day initialized -> {today_key()}")
 
 
@@ -1298,7 +1568,7 @@ def cmd_backlog(args):
     """Handle backlog subcommands: add, list, pull, remove."""
     data = load()
     today = ensure_today(data)
-    backlog = get_backlog(data)
+    backlog = data["backlog"]  # Created by ensure_today() if missing
 
     if args.subcmd == "add":
         # Validate task name
@@ -1312,7 +1582,7 @@ def cmd_backlog(args):
         task_data = create_task_data(clean_task)
         backlog.append(task_data)
 
-        if save(data):
+        if save(data, durable=True):
             safe_print(f"{emoji('backlog_add')} Backlog task added: {clean_task}")
 
     elif args.subcmd == "list":
@@ -1383,26 +1653,14 @@ def cmd_backlog(args):
 
         task_item = backlog.pop(idx)
 
-        # Handle different backlog item formats
-        if isinstance(task_item, dict) and "task" in task_item:
-            if isinstance(task_item["task"], dict):
-                # New structured format
-                today["todo"] = task_item["task"]
-                task_text = task_item["task"]["task"]
-            else:
-                # Old format
-                task_text = task_item["task"]
-                today["todo"] = create_task_data(task_text)
-        else:
-            # Very old format
-            task_text = str(task_item)
-            today["todo"] = create_task_data(task_text)
+        today["todo"] = backlog_item_task(task_item)
+        task_text = today["todo"]["task"]
 
-        if save(data):
+        if save(data, durable=True):
             safe_print(
                 f"{emoji('backlog_pull')} Pulled from backlog: {repr(task_text)}"
             )
-            cmd_status(args)
+            cmd_status(args, data=data)
 
     elif args.subcmd == "remove":
         if not backlog:
@@ -1414,15 +1672,9 @@ def cmd_backlog(args):
             removed = backlog.pop(index)
 
             # Get task text for display
-            if isinstance(removed, dict) and "task" in removed:
-                if isinstance(removed["task"], dict):
-                    task_text = removed["task"]["task"]
-                else:
-                    task_text = removed["task"]
-            else:
-                task_text = str(removed)
+            task_text = backlog_item_text(removed)
 
-            if save(data):
+            if save(data, durable=True):
                 safe_print(f"{emoji('error')} Removed from backlog: {repr(task_text)}")
         else:
             safe_print(
@@ -1453,16 +1705,14 @@ def cmd_backlog(args):
 
         task_text = task_to_cancel.get("task", "Unknown task")
         task_to_cancel["state"] = "cancelled"
-        task_to_cancel["cancellation_date"] = datetime.now().isoformat(
-            timespec="seconds"
-        )
+        task_to_cancel["cancellation_date"] = now_timestamp()
 
         # Move to history
         if "history" not in data:
             data["history"] = []
         data["history"].append(task_to_cancel)
 
-        if save(data):
+        if save(data, durable=True):
             safe_print(f"{emoji('error')} Cancelled from backlog: {repr(task_text)}")
         else:
             backlog.insert(index_to_cancel, task_to_cancel)
@@ -1473,6 +1723,21 @@ def cmd_backlog(args):
             )
 
 
+def cmd_timer(args):
+    """
+    Run the Pomodoro timer.
+
+    The timer module is imported on first use so task commands don't pay
+    for it at start-up.
+
+    Args:
+        args: Command line arguments with work and break_time attributes.
+    """
+    from momentum.timer import cmd_timer as run_timer
+
+    run_timer(args)
+
+
 def cmd_cancel(args):
     global STORE
     if hasattr(args, "store") and args.store:
@@ -1492,7 +1757,7 @@ def cmd_cancel(args):
         today["done"].append(create_done_item(task_to_cancel))
         today["todo"] = None
 
-        if save(data):
+        if save(data, durable=True):
             safe_print(f"{emoji('error')} Cancelled: '{task_to_cancel.get('task')}'")
         else:
             safe_print(f"{emoji('error')} Failed to save cancelled task.")
@@ -1529,16 +1794,28 @@ def cmd_history(args):
         safe_print(f"- {task_text} [{state}] {ts_str}")
 
 
+def cmd_dump(args):
+    """Pretty-print the storage file, which is kept compact on disk."""
+    data = load()
+    safe_print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
 # ===== Argparse + main =====
 
 
+@lru_cache(maxsize=1)
 def build_parser():
     """
     Build and configure the argument parser for all CLI commands.
 
+    The parser is built once per process and shared by main(), the
+    interactive shell and the Sphinx-facing ``cli_parser`` attribute.
+
     Returns:
         argparse.ArgumentParser: Configured argument parser for Momentum CLI.
     """
+    import argparse  # Deferred: fast-path commands never build the parser
+
     p = argparse.ArgumentParser(description="One-task-at-a-time tracker")
     p.add_argument("--store", default=None, help="Custom storage path")
     p.add_argument("--plain", action="store_true", help="Disable emoji / colour")
@@ -1574,6 +1851,13 @@ def build_parser():
     )
     history_parser.set_defaults(func=cmd_history)
 
+    sub.add_parser("dump", help="Pretty-print the storage file").set_defaults(
+        func=cmd_dump
+    )
+    sub.add_parser(
+        "shell", help="Run commands interactively in one session"
+    ).set_defaults(func=cmd_shell)
+
     b = sub.add_parser("backlog")
     b_sub = b.add_subparsers(dest="subcmd", required=True)
 
@@ -1619,12 +1903,66 @@ def build_parser():
     return p
 
 
-def main():
-    """Main entry point for the task tracker CLI."""
-    setup_console_encoding()  # Set up Unicode handling
+def __getattr__(name):
+    # Expose a parser instance for Sphinx autoprogram, built only on request
+    if name == "cli_parser":
+        return build_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-    args = build_parser().parse_args()
+def parse_fast_path(argv):
+    """
+    Recognise the most common invocations without building the argparse parser.
+
+    Handles the argument-free commands (``status``, ``newday``, ``done``,
+    ``dump``, ``shell``) and ``add`` followed by plain words. Leading
+    ``--plain`` and ``--store PATH`` options are accepted. Anything else
+    (other commands, options after the command, ``--help``) returns None so
+    the full parser handles it, including its error messages.
+
+    Args:
+        argv: Command line arguments, excluding the program name.
+
+    Returns:
+        SimpleNamespace shaped like the parsed argparse result, or None.
+    """
+    commands = {
+        "status": cmd_status,
+        "newday": cmd_newday,
+        "done": cmd_done,
+        "dump": cmd_dump,
+        "shell": cmd_shell,
+    }
+    plain = False
+    store = None
+    rest = list(argv)
+    while rest and rest[0].startswith("-"):
+        opt = rest.pop(0)
+        if opt == "--plain":
+            plain = True
+        elif opt == "--store" and rest and not rest[0].startswith("-"):
+            store = rest.pop(0)
+        elif opt.startswith("--store="):
+            store = opt[len("--store=") :]
+        else:
+            return None
+    if not rest:
+        return None
+
+    cmd, params = rest[0], rest[1:]
+    if cmd in commands and not params:
+        return SimpleNamespace(
+            cmd=cmd, plain=plain, store=store, filter=None, func=commands[cmd]
+        )
+    if cmd == "add" and params and not any(p.startswith("-") for p in params):
+        return SimpleNamespace(
+            cmd=cmd, plain=plain, store=store, task=params, func=cmd_add
+        )
+    return None
 
+
+def run_command(args):
+    """Apply global options from parsed arguments and run the selected command."""
     if args.cmd == "add" or (args.cmd == "backlog" and args.subcmd == "add"):
         args.task = " ".join(args.task)
 
@@ -1636,8 +1974,58 @@ def main():
     args.func(args)
 
 
+def cmd_shell(args):
+    """
+    Run commands interactively, reusing one parser for the whole session.
+
+    Each line is parsed like a normal command line, e.g. ``add Write report``.
+    The session's --plain/--store apply to every line unless overridden.
+    Type ``exit`` or ``quit`` (or send EOF) to leave.
+    """
+    import shlex
+
+    global STORE
+    session_store = STORE
+    parser = build_parser()
+    while True:
+        try:
+            line = input("momentum> ").strip()
+        except (KeyboardInterrupt, EOFError):
+            safe_print("")
+            return
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            return
+
+        try:
+            line_args = parser.parse_args(shlex.split(line))
+        except ValueError as e:  # Unbalanced quotes
+            safe_print(f"{emoji('error')} {e}")
+            continue
+        except SystemExit:
+            continue  # argparse already printed usage or help
+        if line_args.func is cmd_shell:
+            safe_print(f"{emoji('error')} Already in the shell.")
+            continue
+
+        line_args.plain = line_args.plain or args.plain
+        line_args.store = line_args.store or args.store
+        try:
+            run_command(line_args)
+        except SystemExit:
+            continue  # e.g. a cancelled timer; keep the session going
+        finally:
+            STORE = session_store  # a one-off --store only applies to its own line
+
+
+def main():
+    """Main entry point for the task tracker CLI."""
+    setup_console_encoding()  # Set up Unicode handling
+
+    args = parse_fast_path(sys.argv[1:]) or build_parser().parse_args()
+    run_command(args)
+
+
 if __name__ == "__main__":
     main()
-
-# Expose a parser instance for Sphinx autoprogram
-cli_parser = build_parser()
@@ -1,10 +1,12 @@
 """Pomodoro timer functionality for Momentum."""
 
 import time
-import signal
 import sys
 from .display import print_timer_status
 
+# Seconds between progress redraws in plain mode
+PLAIN_TICK_SECONDS = 5
+
 
 class PomodoroTimer:
     """
@@ -54,14 +56,19 @@ class PomodoroTimer:
 
         Handles SIGINT for graceful cancellation and runs both work and break sessions.
         """
+        import signal  # Only the timer needs it; keep it off the CLI start-up path
+
         self.is_running = True
-        signal.signal(signal.SIGINT, self._handle_cancel)
+        previous_handler = signal.signal(signal.SIGINT, self._handle_cancel)
 
         try:
             self._run_work_session()
             self._run_break_session()
         except KeyboardInterrupt:
             self._handle_cancel(None, None)
+        finally:
+            # Put back the caller's handler so Ctrl+C behaves normally afterwards
+            signal.signal(signal.SIGINT, previous_handler)
 
     def _run_work_session(self):
         """Run work session with basic countdown."""
@@ -76,11 +83,24 @@ class PomodoroTimer:
         print("\n🎉 Break complete!")
 
     def _countdown(self, duration: int, phase: str):
-        """Enhanced countdown with progress bar."""
-        for remaining in range(duration, -1, -1):  # Include 0 in the countdown
+        """
+        Enhanced countdown with progress bar.
+
+        Sleeps until fixed deadlines measured from the start of the phase rather
+        than a flat second per tick, so print overhead never accumulates as drift.
+        Plain mode redraws less often since it is mostly used for logs/CI.
+        """
+        tick = PLAIN_TICK_SECONDS if self.plain_mode else 1
+        start = time.monotonic()
+        elapsed = 0
+        while True:
+            remaining = duration - elapsed
             print_timer_status(phase, remaining, duration, self.plain_mode)
-            if remaining > 0:  # Only sleep if there's time remaining
-                time.sleep(1)
+            if remaining <= 0:
+                break
+            # Catch up if the process was suspended, but never skip past the end
+            elapsed = min(duration, max(elapsed + tick, int(time.monotonic() - start)))
+            time.sleep(max(0.0, start + elapsed - time.monotonic()))
         print()  # New line after completion
 
     def _handle_cancel(self, signum, frame):
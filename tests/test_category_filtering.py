@@ -7,6 +7,7 @@ from momentum.cli import (
     parse_filter_string,
     filter_tasks_by_tags_or_categories,
     filter_single_task_by_tags_or_categories,
+    view_matches_filter,
     cmd_status,
     cmd_backlog,
 )
@@ -642,6 +643,27 @@ class TestFilterSingleTaskByCategories:
             is True
         )
 
+    def test_view_matches_filter(self):
+        """Test matching pre-merged view names against filter sets."""
+        work, urgent = frozenset({"work"}), frozenset({"urgent"})
+        assert view_matches_filter(["Work"], ["urgent"], work, urgent) is True
+        assert view_matches_filter(["work"], [], work, frozenset()) is True
+        assert view_matches_filter(["home"], ["urgent"], work, urgent) is False
+        assert view_matches_filter([], [], frozenset(), frozenset()) is True
+
+    def test_set_filters_accepted(self):
+        """Test that filters may be passed as sets with mixed case."""
+        task = {"task": "Task @Work #urgent", "categories": [], "tags": []}
+        assert (
+            filter_single_task_by_tags_or_categories(
+                task, filter_categories={"WORK", "home"}, filter_tags={"Urgent"}
+            )
+            is True
+        )
+        assert (
+            filter_single_task_by_tags_or_categories(task, filter_tags={"low"}) is False
+        )
+
 
 class TestStatusCommandFiltering:
     """Test status command with filtering (mocked storage)."""
@@ -17,18 +17,28 @@ from momentum.cli import (
     get_backlog,
     cmd_cancel,
     cmd_history,
+    cmd_dump,
+    cmd_shell,
     merge_and_dedup_case_insensitive,
     safe_print,
     safe_int_input,
+    safe_input,
     migrate_task_data,
     parse_filter_string,
     filter_tasks_by_tags_or_categories,
     filter_single_task_by_tags_or_categories,
     validate_tag_format,
     extract_categories_from_tasks,
+    extract_categories_and_tags,
+    extract_tags_from_tasks,
+    task_view,
+    backlog_item_text,
+    backlog_item_task,
     prompt_next_action,
     create_task_data,
+    parse_fast_path,
 )
+import momentum.cli
 
 
 class TestCmdAdd:
@@ -217,16 +227,38 @@ class TestCmdDone:
         args = MagicMock()
         args.store = str(temp_storage)  # Ensure cmd_done uses temp_storage
 
-        with patch("momentum.cli.save", return_value=False), patch(
+        with patch("momentum.cli.save", return_value=False) as mock_save, patch(
             "momentum.cli.handle_next_task_selection"
         ) as mock_handle_next, patch(
             "momentum.cli.today_key", return_value="2025-05-30"
         ):
             cmd_done(args)
 
-            # With the updated code, cmd_done returns early if save fails
-            # so handle_next_task_selection should NOT be called
-            mock_handle_next.assert_not_called()
+            # cmd_done saves once, after the next-task prompt has run
+            mock_handle_next.assert_called_once()
+            mock_save.assert_called_once()
+
+    def test_done_with_pull_saves_once(self, temp_storage, plain_mode, capsys):
+        """Completing a task and pulling the next one writes storage once."""
+        data = {
+            "2025-05-30": {
+                "todo": {"task": "Test task", "state": "active"},
+                "done": [],
+            },
+            "backlog": [{"task": "Next task", "state": "active"}],
+        }
+        temp_storage.write_text(json.dumps(data), encoding="utf-8")
+
+        with patch("momentum.cli.safe_input", return_value="1"), patch(
+            "momentum.cli.save", return_value=True
+        ) as mock_save, patch("momentum.cli.today_key", return_value="2025-05-30"):
+            cmd_done(MagicMock())
+
+        mock_save.assert_called_once()
+        saved = mock_save.call_args[0][0]
+        assert saved["2025-05-30"]["todo"]["task"] == "Next task"
+        assert saved["backlog"] == []
+        assert len(saved["2025-05-30"]["done"]) == 1
 
 
 class TestCompleteCurrentTask:
@@ -344,6 +376,22 @@ class TestHandleNextTaskSelection:
         # Check nothing was changed
         assert today["todo"] is None
 
+    def test_menu_printed_in_one_write(self, plain_mode):
+        """Test that the selection menu is emitted as a single print."""
+        data = {"backlog": [], "2025-05-30": {"todo": None, "done": []}}
+        today = data["2025-05-30"]
+
+        with patch("momentum.cli.safe_input", return_value=""), patch(
+            "momentum.cli.safe_print"
+        ) as mock_print:
+            handle_next_task_selection(data, today)
+
+        menu_calls = [
+            c for c in mock_print.call_args_list if "Select next task" in c.args[0]
+        ]
+        assert len(menu_calls) == 1
+        assert "[Enter] to skip" in menu_calls[0].args[0]
+
     def test_user_cancels_input(self, plain_mode):
         """Test user cancelling input (Ctrl+C)."""
         data = {"backlog": [], "2025-05-30": {"todo": None, "done": []}}
@@ -405,6 +453,32 @@ class TestCmdStatus:
         assert "No completed tasks yet." in captured.out
         assert "TBD" in captured.out
 
+    def test_status_writes_report_once(self, temp_storage, plain_mode):
+        """Test the status report is emitted with a single print call."""
+        data = {
+            "2025-05-30": {
+                "todo": "Active task",
+                "done": [
+                    {"id": "a", "task": "Done task", "ts": "2025-05-30T09:00:00.123456"}
+                ],
+            },
+            "backlog": [],
+        }
+
+        with patch("momentum.cli.today_key", return_value="2025-05-30"), patch(
+            "builtins.print"
+        ) as mock_print:
+            cmd_status(None, data=data)
+
+        mock_print.assert_called_once()
+        report = mock_print.call_args[0][0]
+        assert report.splitlines()[1:] == [
+            "=== TODAY: 2025-05-30 ===",
+            "Done task [09:00:00]",
+            "Active task",
+            "=" * 27,
+        ]
+
     def test_status_with_active_task(self, temp_storage, plain_mode, capsys):
         """Test status display with active task."""
         # Use legacy string format to test backward compatibility
@@ -466,6 +540,22 @@ class TestCmdStatus:
         assert "[09:00:00]" in captured.out
         assert "[10:30:00]" in captured.out
 
+    def test_status_uses_preloaded_data(self, temp_storage, plain_mode, capsys):
+        """Test status renders passed-in data without reading storage again."""
+        data = {"2025-05-30": {"todo": "In-memory task", "done": []}, "backlog": []}
+
+        args = MagicMock()
+        args.store = str(temp_storage)
+        args.filter = None
+
+        with patch("momentum.cli.today_key", return_value="2025-05-30"), patch(
+            "momentum.cli.load"
+        ) as mock_load:
+            cmd_status(args, data=data)
+
+        mock_load.assert_not_called()
+        assert "In-memory task" in capsys.readouterr().out
+
 
 class TestCmdNewday:
     """Test the cmd_newday command function."""
@@ -492,6 +582,21 @@ class TestCmdNewday:
         assert today_key_val in loaded_data_after_cmd
         assert "backlog" in loaded_data_after_cmd
 
+    def test_newday_already_initialized_skips_save(
+        self, temp_storage, plain_mode, capsys
+    ):
+        """Test newday does not rewrite storage when today already exists."""
+        data = {"2025-05-30": {"todo": None, "done": []}, "backlog": []}
+        temp_storage.write_text(json.dumps(data), encoding="utf-8")
+
+        with patch("momentum.cli.save") as mock_save, patch(
+            "momentum.cli.today_key", return_value="2025-05-30"
+        ):
+            cmd_newday(MagicMock())
+
+        mock_save.assert_not_called()
+        assert "New day initialized -> 2025-05-30" in capsys.readouterr().out
+
     def test_newday_save_failure(self, temp_storage, plain_mode, capsys):
         """Test new day initialization when save fails."""
         args = MagicMock()
@@ -997,6 +1102,87 @@ class TestCmdHistory:
         assert "No matching tasks in history." in captured.out
 
 
+class TestCmdDump:
+    """Test the cmd_dump command function."""
+
+    def test_dump_pretty_prints_storage(self, temp_storage, capsys):
+        """Test dump prints the stored JSON indented and unescaped."""
+        data = {"backlog": [{"task": "Café run", "state": "active"}]}
+        temp_storage.write_text(json.dumps(data), encoding="utf-8")
+
+        cmd_dump(MagicMock())
+
+        out = capsys.readouterr().out
+        assert json.loads(out) == data
+        assert '\n  "backlog": [' in out
+        assert "Café run" in out
+
+
+class TestCmdShell:
+    """Test the interactive shell command."""
+
+    def test_shell_runs_commands_until_exit(self, temp_storage, plain_mode, capsys):
+        """Test lines are dispatched with the session's options until exit."""
+        args = MagicMock(plain=True, store=str(temp_storage))
+        lines = ["", "add Write report", "backlog add Later task", "exit", "status"]
+
+        with patch("builtins.input", side_effect=lines), patch(
+            "momentum.cli.today_key", return_value="2025-05-30"
+        ):
+            cmd_shell(args)
+
+        out = capsys.readouterr().out
+        assert "Added: Write report" in out
+        assert "Backlog task added: Later task" in out
+        assert "=== TODAY" in out  # from the status shown after add
+
+        data = json.loads(temp_storage.read_text(encoding="utf-8"))
+        assert data["2025-05-30"]["todo"]["task"] == "Write report"
+        assert data["backlog"][0]["task"] == "Later task"
+
+    def test_shell_survives_bad_lines(self, temp_storage, plain_mode, capsys):
+        """Test parse errors, bad quoting and nesting don't end the session."""
+        args = MagicMock(plain=True, store=str(temp_storage))
+        lines = ["bogus", 'add "unclosed', "shell"]
+
+        with patch("builtins.input", side_effect=lines + [EOFError]):
+            cmd_shell(args)
+
+        captured = capsys.readouterr()
+        assert "invalid choice" in captured.err
+        assert "No closing quotation" in captured.out
+        assert "Already in the shell." in captured.out
+
+    def test_shell_survives_command_exit(self, temp_storage, plain_mode, capsys):
+        """Test a command calling sys.exit (e.g. a cancelled timer) doesn't end the session."""
+        args = MagicMock(plain=True, store=str(temp_storage))
+        lines = ["timer 1", "add After timer", "exit"]
+
+        with patch("builtins.input", side_effect=lines), patch(
+            "momentum.timer.PomodoroTimer.start", side_effect=SystemExit(0)
+        ):
+            cmd_shell(args)
+
+        assert "Added: After timer" in capsys.readouterr().out
+
+    def test_shell_store_override_is_per_line(self, temp_storage, plain_mode, tmp_path):
+        """Test a --store given on one line doesn't leak into later lines."""
+        other = tmp_path / "other.json"
+        args = MagicMock(plain=True, store=None)
+        lines = [f"--store {other} add Elsewhere", "add At home", "exit"]
+
+        with patch("builtins.input", side_effect=lines), patch(
+            "momentum.cli.today_key", return_value="2025-05-30"
+        ):
+            cmd_shell(args)
+
+        assert momentum.cli.STORE == temp_storage
+        home = json.loads(temp_storage.read_text(encoding="utf-8"))
+        elsewhere = json.loads(other.read_text(encoding="utf-8"))
+        assert home["2025-05-30"]["todo"]["task"] == "At home"
+        assert elsewhere["2025-05-30"]["todo"]["task"] == "Elsewhere"
+
+
 class TestUtilityFunctions:
     """Test utility functions in cli.py."""
 
@@ -1053,6 +1239,19 @@ class TestUtilityFunctions:
             result = safe_int_input("Enter number: ", min_val=1, max_val=10)
             assert result == 10
 
+    def test_safe_input_prompt_encoding(self):
+        """Test prompts pass through on UTF-8 consoles and degrade on ASCII ones."""
+        with patch("momentum.cli.sys.stdout") as mock_stdout, patch(
+            "builtins.input", return_value=" answer "
+        ) as mock_input:
+            mock_stdout.encoding = "UTF-8"
+            assert safe_input("Next → ") == "answer"
+            mock_input.assert_called_with("Next → ")
+
+            mock_stdout.encoding = "ascii"
+            assert safe_input("Next → ") == "answer"
+            mock_input.assert_called_with("Next ? ")
+
     def test_migrate_task_data(self):
         """Test task data migration."""
         data = {
@@ -1199,6 +1398,56 @@ class TestUtilityFunctions:
             "review",
         }
 
+    def test_extract_categories_and_tags(self):
+        """Test categories and tags are collected together in one pass."""
+        tasks = [
+            {"task": "New @work #urgent", "categories": ["work"], "tags": ["urgent"]},
+            {"task": "Legacy @home #later"},
+            {"task": {"task": "Nested #review", "categories": ["project"]}},
+            {},
+        ]
+        categories, tags = extract_categories_and_tags(tasks)
+        assert categories == ["home", "project", "work"]
+        assert tags == ["later", "review", "urgent"]
+        assert extract_tags_from_tasks(tasks) == tags
+
+    def test_task_view_normalizes_layouts(self):
+        """Test every stored task layout yields the same display fields."""
+        structured = {"task": "Ship @work", "categories": ["work"], "tags": ["urgent"]}
+        layouts = [
+            structured,
+            {"id": "a", "task": structured, "ts": "2025-05-30T09:00:00"},
+        ]
+        for item in layouts:
+            assert task_view(item) == (
+                "Ship @work",
+                ["work"],
+                ["urgent"],
+                "Ship @work #urgent",
+            )
+
+        assert task_view({"task": "Legacy #later"}) == (
+            "Legacy #later",
+            [],
+            ["later"],
+            "Legacy #later",
+        )
+        assert task_view("Bare @home") == ("Bare @home", ["home"], [], "Bare @home")
+
+    def test_backlog_item_accessors(self):
+        """Test backlog items of every layout resolve to text and a task dict."""
+        nested = {"task": "Nested @work", "categories": ["work"], "tags": []}
+        wrapped = {"task": nested, "ts": "2025-05-30T09:00:00"}
+        assert backlog_item_text(wrapped) == "Nested @work"
+        assert backlog_item_task(wrapped) is nested
+
+        for legacy in ({"task": "Legacy #later"}, "Legacy #later"):
+            assert backlog_item_text(legacy) == "Legacy #later"
+            task = backlog_item_task(legacy)
+            assert task["task"] == "Legacy #later"
+            assert task["tags"] == ["later"]
+            assert task["state"] == "active"
+
     def test_prompt_next_action(self, capsys):
         """Test next action prompting."""
         data = {"backlog": [{"task": "Backlog task"}]}
@@ -1250,3 +1499,57 @@ class TestUtilityFunctions:
         assert task_data["task"] == "Task @work @personal #urgent #review"
         assert set(task_data["categories"]) == {"work", "personal"}
         assert set(task_data["tags"]) == {"urgent", "review"}
+
+
+class TestParseFastPath:
+    """Test the argparse-free dispatch for argument-free commands."""
+
+    def test_bare_commands(self):
+        """Test status and newday are dispatched without the parser."""
+        args = parse_fast_path(["status"])
+        assert args.cmd == "status"
+        assert args.func.__name__ == "cmd_status"
+        assert args.plain is False
+        assert args.store is None
+        assert args.filter is None
+
+        assert parse_fast_path(["newday"]).func.__name__ == "cmd_newday"
+        assert parse_fast_path(["done"]).func.__name__ == "cmd_done"
+
+    def test_add_with_words(self):
+        """Test add collects its words like argparse's nargs='+'."""
+        args = parse_fast_path(["--plain", "add", "Write", "report", "@work"])
+        assert args.cmd == "add"
+        assert args.func.__name__ == "cmd_add"
+        assert args.task == ["Write", "report", "@work"]
+        assert args.plain is True
+
+    def test_global_options(self):
+        """Test leading --plain and --store are honoured."""
+        args = parse_fast_path(["--plain", "--store", "x.json", "status"])
+        assert args.plain is True
+        assert args.store == "x.json"
+
+        assert parse_fast_path(["--store=y.json", "newday"]).store == "y.json"
+
+    def test_falls_back_to_argparse(self):
+        """Test anything else is left to the full parser."""
+        assert parse_fast_path([]) is None
+        assert parse_fast_path(["done", "extra"]) is None
+        assert parse_fast_path(["add"]) is None
+        assert parse_fast_path(["add", "task", "--plain"]) is None
+        assert parse_fast_path(["--store"]) is None
+        assert parse_fast_path(["status", "--filter", "@work"]) is None
+        assert parse_fast_path(["--help"]) is None
+        assert parse_fast_path(["--store", "--plain", "status"]) is None
+        assert parse_fast_path(["--bogus", "status"]) is None
+
+    def test_build_parser_is_cached(self):
+        """Test the argparse tree is only built once per process."""
+        assert momentum.cli.build_parser() is momentum.cli.build_parser()
+
+    def test_cli_parser_still_exposed(self):
+        """Test the Sphinx-facing cli_parser attribute builds on demand."""
+        args = momentum.cli.cli_parser.parse_args(["--plain", "status"])
+        assert args.func.__name__ == "cmd_status"
+        assert args.plain is True
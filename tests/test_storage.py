@@ -1,8 +1,17 @@
 """Tests for storage operations."""
 
 import json
+import pytest
 from unittest.mock import patch
-from momentum.cli import load, save, ensure_today, get_backlog
+from momentum.cli import (
+    load,
+    save,
+    ensure_today,
+    get_backlog,
+    peek_today,
+    _read_storage,
+    encode_storage,
+)
 import os
 
 
@@ -41,13 +50,20 @@ class TestLoad:
         assert backup_file.exists()
         assert backup_file.read_text() == "invalid json content"
 
-    @patch("momentum.cli.STORE")
-    def test_load_permission_error(self, mock_store, capsys):
+    def test_read_storage_reads_whole_file(self, temp_storage):
+        """Test the raw reader returns every byte, beyond a single read chunk."""
+        payload = ("é" * 10000).encode("utf-8")
+        temp_storage.write_bytes(payload)
+        assert _read_storage(temp_storage)[0] == payload
+
+    def test_load_permission_error(self, temp_storage, capsys):
         """Test loading with permission error."""
-        mock_store.exists.return_value = True
-        mock_store.read_text.side_effect = PermissionError("Access denied")
+        temp_storage.write_text("{}", encoding="utf-8")
 
-        result = load()
+        with patch(
+            "momentum.cli.os.open", side_effect=PermissionError("Access denied")
+        ):
+            result = load()
         assert result == {}
 
         captured = capsys.readouterr()
@@ -66,17 +82,67 @@ class TestSave:
         saved_data = json.loads(temp_storage.read_text(encoding="utf-8"))
         assert saved_data == sample_data
 
-    @patch("momentum.cli.STORE")
-    def test_save_permission_error(self, mock_store, capsys):
-        """Test save with permission error."""
-        mock_store.write_text.side_effect = PermissionError("Access denied")
+    def test_save_fsyncs_only_when_durable(self, temp_storage, sample_data):
+        """Test durable saves fsync the temp file and plain saves do not."""
+        with patch("momentum.cli.os.fsync") as mock_fsync:
+            assert save(sample_data) is True
+            mock_fsync.assert_not_called()
+
+            sample_data["backlog"].append({"task": "Another", "ts": "x"})
+            assert save(sample_data, durable=True) is True
+            # The temp file, plus the containing directory on POSIX
+            assert mock_fsync.call_count == (2 if os.name == "posix" else 1)
+
+        assert json.loads(temp_storage.read_text(encoding="utf-8")) == sample_data
+
+    def test_save_skips_unchanged_payload(self, temp_storage, sample_data):
+        """Test saving identical data again does not rewrite the file."""
+        assert save(sample_data) is True
+
+        with patch("momentum.cli.os.replace") as mock_replace:
+            assert save(sample_data, durable=True) is True
+            mock_replace.assert_not_called()
 
-        result = save({"test": "data"})
+    def test_save_rewrites_after_external_change(self, temp_storage, sample_data):
+        """Test a file modified behind our back is rewritten even if data matches."""
+        assert save(sample_data) is True
+        temp_storage.write_text("{}", encoding="utf-8")
+
+        assert save(sample_data) is True
+        assert json.loads(temp_storage.read_text(encoding="utf-8")) == sample_data
+
+    def test_save_after_load_reuses_read_stat(self, temp_storage):
+        """Test an unchanged save after load needs one stat and no write."""
+        data = {"backlog": [{"task": "Keep", "ts": "x", "state": "active"}]}
+        temp_storage.write_bytes(encode_storage(data))
+        loaded = load()
+
+        with patch("momentum.cli.os.stat", wraps=os.stat) as mock_stat, patch(
+            "momentum.cli.os.replace"
+        ) as mock_replace:
+            assert save(loaded) is True
+        mock_replace.assert_not_called()
+        assert mock_stat.call_count == 1
+
+    def test_save_permission_error(self, temp_storage, capsys):
+        """Test save with permission error."""
+        with patch("momentum.cli.os.replace", side_effect=PermissionError("Denied")):
+            result = save({"test": "data"})
         assert result is False
 
         captured = capsys.readouterr()
         assert "Cannot save to storage file" in captured.out
 
+    def test_save_failure_keeps_existing_file(self, temp_storage):
+        """Test a failed save leaves the previous file and no temp file behind."""
+        temp_storage.write_text(json.dumps({"old": "data"}), encoding="utf-8")
+
+        with patch("momentum.cli.os.replace", side_effect=OSError("Disk full")):
+            assert save({"new": "data"}) is False
+
+        assert json.loads(temp_storage.read_text(encoding="utf-8")) == {"old": "data"}
+        assert list(temp_storage.parent.iterdir()) == [temp_storage]
+
     def test_save_serialization_error(self, temp_storage, capsys):
         """Test save with non-serializable data."""
         # Create non-serializable data
@@ -89,6 +155,46 @@ class TestSave:
         assert "Data serialization error" in captured.out
 
 
+class TestStorageCodec:
+    """Test the optional orjson codec and its stdlib fallback."""
+
+    def test_stdlib_fallback_round_trip(self, temp_storage, sample_data):
+        """Test save/load work when orjson is not installed."""
+        with patch("momentum.cli.orjson", None):
+            assert save(sample_data) is True
+            assert json.loads(temp_storage.read_bytes()) == sample_data
+            assert load()["backlog"][0]["task"] == "Old backlog task"
+
+    def test_orjson_round_trip(self, temp_storage, sample_data):
+        """Test save/load use orjson when it is available."""
+        orjson = pytest.importorskip("orjson")
+        with patch("momentum.cli.orjson", orjson):
+            assert save(sample_data) is True
+            assert orjson.loads(temp_storage.read_bytes()) == sample_data
+            assert load()["backlog"][1]["task"] == "Recent backlog task"
+
+    def test_storage_is_written_compact(self, temp_storage, sample_data):
+        """Test both codecs write JSON without indentation whitespace."""
+        with patch("momentum.cli.orjson", None):
+            save(sample_data)
+        stdlib_bytes = temp_storage.read_bytes()
+        assert b"\n" not in stdlib_bytes
+        assert b'": ' not in stdlib_bytes
+
+        orjson = pytest.importorskip("orjson")
+        with patch("momentum.cli.orjson", orjson):
+            save(sample_data)
+        assert temp_storage.read_bytes() == stdlib_bytes
+
+    def test_orjson_corrupted_file(self, temp_storage, capsys):
+        """Test orjson decode errors take the corrupted-file recovery path."""
+        orjson = pytest.importorskip("orjson")
+        temp_storage.write_text("invalid json content", encoding="utf-8")
+        with patch("momentum.cli.orjson", orjson):
+            assert load() == {}
+        assert "Storage file corrupted" in capsys.readouterr().out
+
+
 class TestDataStructure:
     """Test data structure helper functions."""
 
@@ -126,6 +232,16 @@ class TestDataStructure:
             else:
                 del os.environ["MOMENTUM_TODAY_KEY"]
 
+    def test_peek_today_does_not_mutate(self, sample_data):
+        """Test peek_today reads today's data without inserting anything."""
+        with patch("momentum.cli.today_key", return_value="2025-05-30"):
+            assert peek_today(sample_data)["todo"] == "Current active task"
+
+        data = {}
+        with patch("momentum.cli.today_key", return_value="2025-06-01"):
+            assert peek_today(data) == {"todo": None, "done": []}
+        assert data == {}
+
     def test_get_backlog_new_data(self):
         """Test get_backlog creates backlog if missing."""
         data = {}
@@ -1,5 +1,7 @@
 """Tests for task categories and tags functionality."""
 
+from unittest.mock import patch
+
 from momentum.cli import (
     parse_tags,
     format_task_with_tags,
@@ -108,6 +110,16 @@ class TestParseTagsEdgeCases:
         assert categories == ["work"]
         assert tags == ["urgent"]
 
+    def test_parse_repeat_returns_fresh_lists(self):
+        """Test memoized parsing never hands out a shared, mutable list."""
+        _, categories, tags = parse_tags("Memo @work #urgent")
+        categories.append("mutated")
+        tags.clear()
+
+        _, categories_again, tags_again = parse_tags("Memo @work #urgent")
+        assert categories_again == ["work"]
+        assert tags_again == ["urgent"]
+
     def test_parse_case_sensitivity(self):
         """Test case sensitivity in tags."""
         task = "Task @Work @PERSONAL #Urgent #low"
@@ -204,6 +216,8 @@ class TestValidateTagFormat:
             "tag@symbol",  # @ in tag
             "tag#hash",  # # in tag
             "a" * 51,  # too long (assuming 50 char limit)
+            "tag\n",  # trailing newline
+            "t\u00e4g",  # non-ASCII letter
         ]
         for tag in invalid_tags:
             assert not validate_tag_format(tag), f"'{tag}' should be invalid"
@@ -244,8 +258,26 @@ class TestFormatTaskWithTags:
         assert "Deploy feature" in result
         assert "@work" in result
         assert "#urgent" in result
-        # Should have ANSI color codes (we'll implement color logic)
-        # assert "\033[" in result  # ANSI escape sequence
+
+    def test_format_highlights_only_known_tags(self):
+        """Test each listed category/tag is coloured and others are left alone."""
+        task = "Ship @Work #urgent #later @workshop"
+
+        with patch("momentum.cli.USE_PLAIN", False):
+            result = format_task_with_tags(task, ["work"], ["urgent"])
+
+        assert result == (
+            "Ship \033[94m@Work\033[0m \033[93m#urgent\033[0m #later @workshop"
+        )
+
+    def test_format_restores_row_style_after_tags(self):
+        """Test text after a tag goes back to the row's colour, not the default."""
+        with patch("momentum.cli.USE_PLAIN", False):
+            result = format_task_with_tags(
+                "Fix @work bug", ["work"], [], row_style="\033[92m"
+            )
+
+        assert result == "Fix \033[94m@work\033[0m\033[92m bug"
 
 
 class TestTagIntegration:
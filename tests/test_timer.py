@@ -30,7 +30,35 @@ class TestPomodoroTimer:
 
         # Should print 00:03, 00:02, 00:01, 00:00, and a newline, plus clear_line prints
         assert mock_print.call_count == 9
-        mock_sleep.assert_called_with(1)
+        assert mock_sleep.call_count == 3
+
+    @patch("builtins.print")
+    def test_countdown_compensates_for_drift(self, mock_print):
+        """Test sleeps shrink to absorb per-tick overhead instead of drifting."""
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            # Each tick costs 0.2s of display work on top of the sleep itself
+            clock[0] += seconds + 0.2
+
+        with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+            "time.sleep", side_effect=fake_sleep
+        ) as mock_sleep:
+            PomodoroTimer(1)._countdown(3, "work")
+
+        sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+        assert sleeps == pytest.approx([1.0, 0.8, 0.8])
+
+    @patch("time.sleep")
+    @patch("momentum.timer.print_timer_status")
+    def test_countdown_plain_mode_ticks_less_often(self, mock_status, mock_sleep):
+        """Test plain mode redraws every PLAIN_TICK_SECONDS and still ends at 0."""
+        timer = PomodoroTimer(1, plain_mode=True)
+        with patch("builtins.print"):
+            timer._countdown(12, "work")
+
+        remaining = [c.args[1] for c in mock_status.call_args_list]
+        assert remaining == [12, 7, 2, 0]
 
     def test_cmd_timer_args(self):
         """Test cmd_timer processes arguments correctly."""
@@ -63,6 +91,16 @@ class TestPomodoroTimer:
         assert not timer.is_running
         mock_exit.assert_called_once_with(0)
 
+    @patch("momentum.timer.PomodoroTimer._countdown")
+    @patch("builtins.print")
+    def test_timer_restores_sigint_handler(self, mock_print, mock_countdown):
+        """Test the previous SIGINT handler is put back once the timer ends."""
+        import signal
+
+        previous = signal.getsignal(signal.SIGINT)
+        PomodoroTimer(25, 5).start()
+        assert signal.getsignal(signal.SIGINT) is previous
+
     @patch("momentum.timer.PomodoroTimer._countdown")
     @patch("builtins.print")
     def test_timer_completion(self, mock_print, mock_countdown):
@@ -112,6 +112,21 @@ class TestPrintBacklogList:
         assert "2. Second task [05/30 11:30]" in captured.out
         assert "3. Third task [05/30 15:45]" in captured.out
 
+    def test_backlog_written_in_one_call(self):
+        """Test the header and all rows are emitted with a single print."""
+        backlog = [
+            {"task": "First task", "ts": "2025-05-30T10:00:00"},
+            {"task": "Second task", "ts": "2025-05-30T11:30:00"},
+        ]
+        with patch("builtins.print") as mock_print:
+            print_backlog_list(backlog)
+
+        mock_print.assert_called_once()
+        assert mock_print.call_args[0][0].splitlines()[1:] == [
+            " 1. First task [05/30 10:00]",
+            " 2. Second task [05/30 11:30]",
+        ]
+
     def test_custom_title(self, capsys):
         """Test printing backlog with custom title."""
         backlog = [{"task": "Test task", "ts": "2025-05-30T12:00:00"}]
@@ -209,6 +224,55 @@ class TestStyleFunction:
         finally:
             momentum.cli.USE_PLAIN = original_plain
 
+    def test_style_drops_codes_the_console_cannot_encode(self):
+        """Test style returns empty for text the stdout encoding rejects."""
+        original_plain = momentum.cli.USE_PLAIN
+        momentum.cli.USE_PLAIN = False
+        try:
+            with patch("momentum.cli.sys.stdout") as mock_stdout:
+                mock_stdout.encoding = "ascii"
+                assert momentum.cli.style("\033[92m") == "\033[92m"
+                assert momentum.cli.style("→") == ""
+        finally:
+            momentum.cli.USE_PLAIN = original_plain
+
+    def test_prompts_use_their_own_bounded_cache(self):
+        """Test prompts with task text don't grow the unbounded style cache."""
+        before = momentum.cli._can_encode.cache_info().currsize
+        with patch("momentum.cli.sys.stdout") as mock_stdout:
+            mock_stdout.encoding = "ascii"
+            for i in range(200):
+                prompt = f"Add 'Task {i} →' to backlog? "
+                safe = momentum.cli._console_safe_prompt(prompt)
+                assert safe == f"Add 'Task {i} ?' to backlog? "
+
+        assert momentum.cli._can_encode.cache_info().currsize == before
+        assert momentum.cli._can_encode_prompt.cache_info().currsize <= 128
+
+
+class TestCompactSgr:
+    """Test merging of adjacent ANSI sequences."""
+
+    def test_adjacent_openers_are_merged(self):
+        """Test back-to-back openers become one sequence."""
+        assert momentum.cli.compact_sgr("\033[1m\033[96mTask") == "\033[1;96mTask"
+
+    def test_redundant_resets_are_collapsed(self):
+        """Test a tag's reset followed by the row reset leaves one reset."""
+        text = "\033[92mDo \033[94m@work\033[0m\033[0m [10:00]"
+        assert (
+            momentum.cli.compact_sgr(text) == "\033[92mDo \033[94m@work\033[0m [10:00]"
+        )
+
+    def test_reset_then_opener(self):
+        """Test a reset followed by an opener is folded into one sequence."""
+        assert momentum.cli.compact_sgr("a\033[0m\033[93m#x") == "a\033[0;93m#x"
+
+    def test_text_without_runs_is_unchanged(self):
+        """Test isolated sequences and plain text pass through."""
+        text = "\033[92mDone\033[0m [10:00]"
+        assert momentum.cli.compact_sgr(text) == text
+
 
 class TestEmojiFunction:
     """Test the emoji function."""
@@ -291,6 +355,21 @@ class TestEmojiFunction:
         finally:
             momentum.cli.USE_PLAIN = original_plain
 
+    def test_emoji_ascii_fallback_follows_stdout_encoding(self):
+        """Test emoji falls back to ASCII per stdout encoding, even once cached."""
+        original_plain = momentum.cli.USE_PLAIN
+        momentum.cli.USE_PLAIN = False
+        try:
+            with patch("momentum.cli.sys.stdout") as mock_stdout:
+                mock_stdout.encoding = "ascii"
+                assert momentum.cli.emoji("added") == "[OK]"
+                assert momentum.cli.emoji("error") == "[!]"
+
+                mock_stdout.encoding = "utf-8"
+                assert momentum.cli.emoji("added") == "✅"
+        finally:
+            momentum.cli.USE_PLAIN = original_plain
+
 
 class TestTodayKey:
     """Test the today_key function."""
@@ -306,9 +385,46 @@ class TestTodayKey:
 
         mock_date.today.return_value = date(2025, 5, 30)
 
-        result = today_key()
+        # The system date is memoized; clear it around the patch
+        momentum.cli._clear_today_cache()
+        try:
+            result = today_key()
+        finally:
+            momentum.cli._clear_today_cache()
         assert result == "2025-05-30"
 
+    def test_today_key_is_memoized(self):
+        """Test the system date lookup runs once and the env override still wins."""
+        momentum.cli._clear_today_cache()
+        with patch("momentum.cli.date") as mock_date, patch.dict(
+            "os.environ", {}, clear=False
+        ) as env:
+            env.pop("MOMENTUM_TODAY_KEY", None)
+            mock_date.today.return_value.isoformat.return_value = "2025-05-30"
+            assert today_key() == "2025-05-30"
+            assert today_key() == "2025-05-30"
+            assert mock_date.today.call_count == 1
+
+            env["MOMENTUM_TODAY_KEY"] = "2025-06-01"
+            assert today_key() == "2025-06-01"
+        momentum.cli._clear_today_cache()
+
+    def test_today_key_cache_expires(self):
+        """Test the system date is re-read once the cache is older than the TTL."""
+        momentum.cli._clear_today_cache()
+        with patch("momentum.cli.date") as mock_date, patch(
+            "momentum.cli.time.monotonic", side_effect=[1000.0, 1010.0, 1061.0]
+        ), patch.dict("os.environ", {}, clear=False) as env:
+            env.pop("MOMENTUM_TODAY_KEY", None)
+            mock_date.today.return_value.isoformat.side_effect = [
+                "2025-05-30",
+                "2025-05-31",
+            ]
+            assert today_key() == "2025-05-30"
+            assert today_key() == "2025-05-30"  # within the TTL
+            assert today_key() == "2025-05-31"  # past it: midnight noticed
+        momentum.cli._clear_today_cache()
+
     def test_today_key_real_date(self):
         """Test today_key with real date (should be current date)."""
         result = today_key()
@@ -376,20 +492,16 @@ class TestTimestampFormatting:
             (
                 "2025-02-29T12:00:00",
                 "[02/29 12:00]",
-            ),  # Leap year (2025 is not leap, but test parsing)
+            ),  # ISO-shaped timestamps are sliced, not calendar-validated
         ]
 
         for timestamp, expected in test_cases:
-            try:
-                result = format_backlog_timestamp(timestamp)
-                if "02/29" in expected:
-                    # 2025 is not a leap year, so this should fall back to original string
-                    assert result == "[2025-02-29T12:00:00]"
-                else:
-                    assert result == expected
-            except ValueError:
-                # Some edge cases might not parse correctly, which is fine
-                pass
+            assert format_backlog_timestamp(timestamp) == expected
+
+    def test_custom_formats_use_strftime(self):
+        """Test non-default Config formats still go through strftime."""
+        with patch("momentum.cli.Config.DATE_FORMAT", "%d.%m"):
+            assert format_backlog_timestamp("2025-05-30T14:30:45") == "[30.05 14:30]"
 
 
 class TestDisplayIntegration: